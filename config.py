@@ -19,12 +19,18 @@ class BedrockConfig:
     REGION = os.environ.get("BEDROCK_REGION", "eu-west-1")
     AGENT_ID = os.environ.get("AGENT_ID", "")
     AGENT_ALIAS_ID = os.environ.get("AGENT_ALIAS_ID", "")
+    # Replay cached agent responses instead of invoking the agent (development only)
+    CACHE_ENABLED = os.environ.get("BEDROCK_CACHE_ENABLED", "false").lower() == "true"
+    CACHE_DIR = os.environ.get("BEDROCK_CACHE_DIR", ".cache/bedrock")
 
 class DatadogConfig:
     """Datadog configuration."""
-    API_KEY = os.environ.get("DATADOG_API_KEY", "")
+    # Fall back to ddtrace's standard variable, which LLMObs.enable would otherwise read itself
+    API_KEY = os.environ.get("DATADOG_API_KEY") or os.environ.get("DD_API_KEY", "")
     SITE = os.environ.get("DATADOG_SITE", "datadoghq.eu")
     ML_APP_NAME = os.environ.get("ML_APP_NAME", "migdal-zone")
+    # Create spans for trace steps with no content (empty rationale, response, ...)
+    EMIT_EMPTY_SPANS = os.environ.get("EMIT_EMPTY_SPANS", "false").lower() == "true"
 
 class LoggingConfig:
     """Logging configuration."""
@@ -35,4 +41,6 @@ class AppConfig:
     """Application-wide configuration."""
     SESSION_TIMEOUT = int(os.environ.get("SESSION_TIMEOUT", "30"))
     MAX_RETRIES = int(os.environ.get("MAX_RETRIES", "3"))
-    CHUNK_SIZE = int(os.environ.get("CHUNK_SIZE", "100")) 
\ No newline at end of file
+    CHUNK_SIZE = int(os.environ.get("CHUNK_SIZE", "100"))
+    MAX_WORKERS = int(os.environ.get("MAX_WORKERS", "1"))
+    RESULTS_FILE = os.environ.get("RESULTS_FILE", "") 
\ No newline at end of file
@@ -4,9 +4,9 @@ Refactored to follow software engineering best practices for AI projects.
 """
 
 import json
-import os
 from runners.test_runner import TestRunner
 from utils.logger import setup_logging
+from utils.file_utils import load_json_file, list_question_files
 
 def load_evaluation_questions(file_path: str = "data/evaluation_questions.json"):
     """
@@ -19,8 +19,7 @@ def load_evaluation_questions(file_path: str = "data/evaluation_questions.json")
         List of question dictionaries
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            questions = json.load(f)
+        questions = list(load_json_file(file_path))
         print(f"✅ Loaded {len(questions)} questions from {file_path}")
         return questions
     except FileNotFoundError:
@@ -49,16 +48,7 @@ def get_default_questions():
 
 def get_available_question_files():
     """Get list of available question files in the data directory."""
-    data_dir = "data"
-    if not os.path.exists(data_dir):
-        return []
-    
-    question_files = []
-    for file in os.listdir(data_dir):
-        if file.endswith('.json') and 'question' in file.lower():
-            question_files.append(os.path.join(data_dir, file))
-    
-    return question_files
+    return list_question_files("data")
 
 def main():
     """Main function with refactored structure."""
@@ -5,6 +5,7 @@ Migration script to help transition from dd_traces.py to the new modular structu
 import json
 import os
 from typing import List, Dict, Any
+from utils.file_utils import load_json_file
 
 def migrate_questions_from_file(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -17,16 +18,16 @@ def migrate_questions_from_file(file_path: str) -> List[Dict[str, Any]]:
         List of questions in the new format
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(file_path)
         
-        # Handle different file formats
+        # Handle different file formats; copy the list so callers can extend it without
+        # touching the cache (the question dicts themselves are still shared)
         if isinstance(data, list):
             # Direct list of questions
-            return data
+            return list(data)
         elif isinstance(data, dict) and 'questions' in data:
             # Questions nested in a dict
-            return data['questions']
+            return list(data['questions'])
         else:
             print(f"❌ Unsupported format in {file_path}")
             return []
@@ -86,12 +87,23 @@ if __name__ == "__main__":
     
     print(f"✅ Created migrated main file: {output_file}")
 
+def _list_directory(path: str) -> set:
+    """Get the entry names in a directory, or an empty set if it can't be read."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 def check_environment_setup():
     """Check if environment is properly set up for the new structure."""
     print("🔍 Checking environment setup...")
     
+    # Read each directory once and check names against it, rather than one stat per path
+    listings = {'': _list_directory('.')}
+    
     # Check for .env file
-    if os.path.exists('.env'):
+    if '.env' in listings['']:
         print("✅ .env file found")
     else:
         print("⚠️  .env file not found - copy from .env-example")
@@ -99,7 +111,7 @@ def check_environment_setup():
     # Check for required directories
     required_dirs = ['models', 'services', 'processors', 'orchestrators', 'runners', 'utils']
     for dir_name in required_dirs:
-        if os.path.exists(dir_name):
+        if dir_name in listings['']:
             print(f"✅ {dir_name}/ directory found")
         else:
             print(f"❌ {dir_name}/ directory missing")
@@ -120,7 +132,10 @@ def check_environment_setup():
     ]
     
     for file_path in required_files:
-        if os.path.exists(file_path):
+        parent, name = os.path.split(file_path)
+        if parent not in listings:
+            listings[parent] = _list_directory(parent)
+        if name in listings[parent]:
             print(f"✅ {file_path} found")
         else:
             print(f"❌ {file_path} missing")
@@ -2,7 +2,7 @@
 Test result model for representing agent test results.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 
@@ -16,12 +16,7 @@ class TestResult:
     duration: float
     success: bool
     error_message: Optional[str] = None
-    timestamp: datetime = None
-    
-    def __post_init__(self):
-        """Set timestamp if not provided."""
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
     
     def to_dict(self) -> dict:
         """Convert test result to dictionary format."""
@@ -39,7 +34,7 @@ class TestResult:
     def from_dict(cls, data: dict) -> 'TestResult':
         """Create test result from dictionary."""
         timestamp_str = data.get("timestamp")
-        timestamp = datetime.fromisoformat(timestamp_str) if timestamp_str else None
+        timestamp = datetime.fromisoformat(timestamp_str) if timestamp_str else datetime.now()
         
         return cls(
             question=data.get("question", ""),
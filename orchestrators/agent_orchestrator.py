@@ -3,13 +3,15 @@ Agent orchestrator module for coordinating Bedrock agent interactions.
 Handles the main workflow of asking agents and processing traces.
 """
 
-import time
+import uuid
 from typing import Optional, Dict, Any
+from config import BedrockConfig
 from services.bedrock_service import BedrockService
 from services.datadog_service import DatadogService
+from services.response_cache import ResponseCache
 from processors.trace_processor import TraceProcessor
 from utils.logger import safe_print, get_logger
-from utils.text_processing import extract_chunks_from_trace
+from utils.text_processing import extract_chunks_from_trace_event, truncate_text
 
 logger = get_logger(__name__)
 
@@ -20,8 +22,13 @@ class AgentOrchestrator:
         """Initialize the orchestrator with required services."""
         self.bedrock_service = BedrockService()
         self.datadog_service = DatadogService()
-        self.trace_processor = TraceProcessor(self.datadog_service.get_llm_obs())
         self.llm_obs = self.datadog_service.get_llm_obs()
+        self.trace_processor = TraceProcessor(self.llm_obs)
+        self.response_cache = ResponseCache() if BedrockConfig.CACHE_ENABLED else None
+        
+        # The agent is fixed for the orchestrator's lifetime; resolve its ID and span name once
+        self.agent_id = self.bedrock_service.get_agent_info()['agent_id']
+        self.agent_span_name = f"bedrock-agent-{self.agent_id}"
     
     def ask_agent_with_traces(self, question: str, expected: Optional[str] = None) -> Optional[str]:
         """
@@ -34,57 +41,89 @@ class AgentOrchestrator:
         Returns:
             Agent response or None if failed
         """
-        output = ""
-        session_id = f"bedrock-trace_{int(time.time())}"
+        output_buf = bytearray()
+        chunks = ""
+        # Raw trace payloads, retained only when they must be written to the response cache
+        cache_traces = None
+        saw_failure = False
+        # Random IDs stay unique across threads and across concurrent runs
+        session_id = f"bedrock-trace_{uuid.uuid4().hex}"
         trace_count = 0
         
         safe_print(f"\n🎯 Starting BEDROCK TRACE CAPTURE for: {question}")
         
+        workflow_metadata = {
+            "workflow_start": True,
+            "expected_answer": expected
+        }
+        workflow_tags = {
+            "workflow": "bedrock_agent",
+            "language": "hebrew"
+        }
+        
         with self.llm_obs.workflow(name="bedrock-agent-workflow", session_id=session_id):
             try:
                 # Annotate the workflow with the initial question
                 self.llm_obs.annotate(
                     input_data=question,
                     output_data="Starting Bedrock agent processing",
-                    metadata={
-                        "workflow_start": True,
-                        "expected_answer": expected
-                    },
-                    tags={
-                        "workflow": "bedrock_agent",
-                        "language": "hebrew"
-                    }
+                    metadata=workflow_metadata,
+                    tags=workflow_tags
                 )
                 
-                with self.llm_obs.agent(name=f"bedrock-agent-{self.bedrock_service.get_agent_info()['agent_id']}", 
-                                      session_id=session_id):
+                with self.llm_obs.agent(name=self.agent_span_name, session_id=session_id):
                     safe_print(f"Processing question: {question}")
                     
-                    # Invoke the agent
-                    response = self.bedrock_service.invoke_agent(question, session_id)
+                    cached = self.response_cache.get(question) if self.response_cache else None
+                    if cached is not None:
+                        # Replay through the normal event loop so spans are still emitted
+                        safe_print("♻️ Replaying cached agent response")
+                        events = ResponseCache.replay_events(cached)
+                    else:
+                        # Invoke the agent
+                        response = self.bedrock_service.invoke_agent(question, session_id)
+                        events = response.get("completion", [])
+                        if self.response_cache:
+                            cache_traces = []
                     
                     safe_print("🔍 Processing trace events...")
                     
                     # Process completion events
-                    for event_index, event in enumerate(response.get("completion", [])):
+                    for event_index, event in enumerate(events):
                         if "chunk" in event:
                             chunk = event["chunk"]
                             if "bytes" in chunk:
-                                text = chunk["bytes"].decode('utf-8')
-                                output += text
-                                safe_print(f"📝 Chunk {event_index + 1}: {text[:50]}{'...' if len(text) > 50 else ''}")
+                                output_buf.extend(chunk["bytes"])
+                                # A multi-byte character may be split across chunks; only the preview is decoded here
+                                text = chunk["bytes"].decode('utf-8', 'replace')
+                                safe_print(f"📝 Chunk {event_index + 1}: {truncate_text(text, 50)}")
                         
                         elif "trace" in event:
+                            trace_event = event["trace"]
+                            # Trace processing and chunk extraction assume dict payloads; enforce it once here
+                            if not isinstance(trace_event, dict):
+                                logger.warning(f"Skipping non-dict trace payload: {type(trace_event).__name__}")
+                                continue
+                            
                             trace_count += 1
+                            if "failureTrace" in (trace_event.get("trace") or {}):
+                                saw_failure = True
                             safe_print(f"🔍 Processing trace event {trace_count}")
-                            self.trace_processor.process_trace_event(event["trace"], session_id)
+                            self.trace_processor.process_trace_event(trace_event, session_id)
+                            
+                            # Extract chunks while streaming; the latest event with retrieved content wins
+                            event_chunks = extract_chunks_from_trace_event(event)
+                            if event_chunks is not None:
+                                chunks = event_chunks
+                            
+                            if cache_traces is not None:
+                                cache_traces.append(trace_event)
                     
-                    # Extract additional chunks using the original method
-                    chunks = extract_chunks_from_trace([
-                        {"trace": event.get("trace", {})} 
-                        for event in response.get("completion", []) 
-                        if "trace" in event
-                    ])
+                    output = output_buf.decode('utf-8')
+                    
+                    # Only successful responses are cached; a failed run must not be replayed
+                    if cache_traces is not None and output and not saw_failure:
+                        self.response_cache.set(question, output, cache_traces)
                     
                     # Annotate the main agent with results
                     self.llm_obs.annotate(
@@ -95,8 +134,9 @@ class AgentOrchestrator:
                             "response_length": len(output),
                             "chunks_extracted": len(chunks) if chunks else 0,
                             "expected_answer": expected,
-                            "agent_id": self.bedrock_service.get_agent_info()['agent_id'],
-                            "session_id": session_id
+                            "agent_id": self.agent_id,
+                            "session_id": session_id,
+                            "from_cache": cached is not None
                         },
                         tags={
                             "agent_type": "bedrock_supervisor",
@@ -131,6 +171,10 @@ class AgentOrchestrator:
         """Flush data to Datadog."""
         return self.datadog_service.flush_data()
     
+    def is_tracing_enabled(self) -> bool:
+        """Check whether LLM Observability is sending data to Datadog."""
+        return self.datadog_service.enabled
+    
     def get_agent_info(self) -> Dict[str, Any]:
         """Get information about the configured agent."""
         return self.bedrock_service.get_agent_info() 
\ No newline at end of file
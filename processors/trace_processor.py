@@ -3,19 +3,48 @@ Trace processor module for handling Bedrock trace events.
 Processes trace events and creates appropriate Datadog spans.
 """
 
-import json
 from typing import Dict, Any
+from config import DatadogConfig
 from utils.logger import safe_print, get_logger
-from utils.text_processing import safe_json_parse, format_response_for_display
+from utils.text_processing import format_response_for_display, json_dumps_pretty, truncate_text
 
 logger = get_logger(__name__)
 
+def _reference_source(ref: Dict[str, Any]) -> str:
+    """Get the S3 URI of a knowledge base reference, or "" if it has none."""
+    location = ref.get("location")
+    s3_location = location.get("s3Location") if location else None
+    return s3_location.get("uri", "") if s3_location else ""
+
 class TraceProcessor:
     """Processor for Bedrock trace events."""
     
     def __init__(self, llm_obs):
         """Initialize trace processor with LLM Observability instance."""
         self.llm_obs = llm_obs
+        
+        # Top-level dispatch: each trace event carries one of these keys
+        self._trace_handlers = {
+            "preProcessingTrace": self._process_preprocessing_trace,
+            "orchestrationTrace": self._process_orchestration_trace,
+            "postProcessingTrace": self._process_postprocessing_trace,
+            "guardrailTrace": self._process_guardrail_trace,
+            "failureTrace": self._process_failure_trace,
+        }
+        
+        # Sub-type dispatch tables: one dict lookup instead of a chain of string compares
+        self._invocation_input_handlers = {
+            "ACTION_GROUP": self._process_action_group_input,
+            "KNOWLEDGE_BASE": self._process_knowledge_base_input,
+            "AGENT_COLLABORATOR": self._process_collaborator_input,
+        }
+        self._observation_handlers = {
+            "ACTION_GROUP": self._process_action_group_output,
+            "KNOWLEDGE_BASE": self._process_knowledge_base_output,
+            "AGENT_COLLABORATOR": self._process_collaborator_output,
+            "FINISH": self._process_final_response,
+            "REPROMPT": self._process_reprompt,
+        }
     
     def process_trace_event(self, trace_event: Dict[str, Any], session_id: str):
         """
@@ -30,58 +59,58 @@ class TraceProcessor:
             agent_id = trace_event.get("agentId", "unknown")
             agent_name = trace_event.get("agentName", "unknown")
             collaborator_name = trace_event.get("collaboratorName", "")
-            trace_data = trace_event.get("trace", {})
+            trace_data = trace_event.get("trace") or {}
             
-            # Process different trace types
-            self._process_preprocessing_trace(trace_data, session_id, agent_name)
-            self._process_orchestration_trace(trace_data, session_id, agent_id, agent_name, collaborator_name)
-            self._process_postprocessing_trace(trace_data, session_id, agent_name)
-            self._process_guardrail_trace(trace_data, session_id)
-            self._process_failure_trace(trace_data, session_id)
+            # Dispatch only the trace types present in this event
+            for trace_type, payload in trace_data.items():
+                handler = self._trace_handlers.get(trace_type)
+                if handler:
+                    handler(payload, session_id, agent_id, agent_name, collaborator_name)
             
         except Exception as e:
             logger.error(f"Error processing trace event: {str(e)}")
             safe_print(f"Error processing trace event: {str(e)}")
     
-    def _process_preprocessing_trace(self, trace_data: Dict[str, Any], session_id: str, agent_name: str):
+    def _should_emit(self, content: Any) -> bool:
+        """Check whether a span should be created for the given payload."""
+        return bool(content) or DatadogConfig.EMIT_EMPTY_SPANS
+    
+    def _process_preprocessing_trace(self, preprocessing: Dict[str, Any], session_id: str,
+                                     agent_id: str, agent_name: str, collaborator_name: str):
         """Process PreProcessingTrace events."""
-        if "preProcessingTrace" not in trace_data:
-            return
-            
-        preprocessing = trace_data["preProcessingTrace"]
-        model_input = preprocessing.get("modelInvocationInput", {})
-        model_output = preprocessing.get("modelInvocationOutput", {})
+        model_input = preprocessing.get("modelInvocationInput") or {}
+        model_output = preprocessing.get("modelInvocationOutput") or {}
+        parsed_response = model_output.get("parsedResponse") or {}
+        model_metadata = model_output.get("metadata") or {}
         
         prompt_text = model_input.get("text", "")
-        rationale = model_output.get("parsedResponse", {}).get("rationale", "")
-        is_valid = model_output.get("parsedResponse", {}).get("isValid", True)
+        rationale = parsed_response.get("rationale", "")
+        is_valid = parsed_response.get("isValid", True)
+        
+        metadata = {
+            "step": "preprocessing",
+            "is_valid": is_valid,
+            "foundation_model": model_input.get("foundationModel", ""),
+            "usage": model_metadata.get("usage") or {}
+        }
+        tags = {
+            "trace_type": "preprocessing",
+            "agent_name": agent_name,
+            "valid_input": str(is_valid)
+        }
         
         with self.llm_obs.task(name="preprocessing-validation", session_id=session_id):
             self.llm_obs.annotate(
                 input_data=prompt_text,
                 output_data=f"Valid: {is_valid}, Rationale: {rationale}",
-                metadata={
-                    "step": "preprocessing",
-                    "is_valid": is_valid,
-                    "foundation_model": model_input.get("foundationModel", ""),
-                    "usage": model_output.get("metadata", {}).get("usage", {})
-                },
-                tags={
-                    "trace_type": "preprocessing",
-                    "agent_name": agent_name,
-                    "valid_input": str(is_valid)
-                }
+                metadata=metadata,
+                tags=tags
             )
-            safe_print(f"✅ Preprocessing: Valid={is_valid}, Rationale={rationale[:50]}...")
+            safe_print(f"✅ Preprocessing: Valid={is_valid}, Rationale={truncate_text(rationale, 50)}")
     
-    def _process_orchestration_trace(self, trace_data: Dict[str, Any], session_id: str, 
+    def _process_orchestration_trace(self, orchestration: Dict[str, Any], session_id: str, 
                                    agent_id: str, agent_name: str, collaborator_name: str):
         """Process OrchestrationTrace events."""
-        if "orchestrationTrace" not in trace_data:
-            return
-            
-        orchestration = trace_data["orchestrationTrace"]
-        
         # Process Rationale
         self._process_rationale(orchestration, session_id, agent_id, agent_name, collaborator_name)
         
@@ -94,328 +123,377 @@ class TraceProcessor:
     def _process_rationale(self, orchestration: Dict[str, Any], session_id: str, 
                           agent_id: str, agent_name: str, collaborator_name: str):
         """Process rationale from orchestration trace."""
-        if "rationale" not in orchestration:
+        rationale = orchestration.get("rationale")
+        if rationale is None:
             return
             
-        rationale = orchestration["rationale"]
         rationale_text = rationale.get("text", "")
         
+        if not self._should_emit(rationale_text):
+            return
+        
+        metadata = {
+            "step": "reasoning",
+            "reasoning_length": len(rationale_text),
+            "agent_id": agent_id,
+            "collaborator": collaborator_name
+        }
+        tags = {
+            "trace_type": "rationale",
+            "agent_name": agent_name,
+            "has_collaborator": bool(collaborator_name)
+        }
+        
         with self.llm_obs.agent(name=f"reasoning-agent-{agent_name}", session_id=session_id):
             self.llm_obs.annotate(
                 input_data="Analyzing user input and determining next steps",
                 output_data=rationale_text,
-                metadata={
-                    "step": "reasoning",
-                    "reasoning_length": len(rationale_text),
-                    "agent_id": agent_id,
-                    "collaborator": collaborator_name
-                },
-                tags={
-                    "trace_type": "rationale",
-                    "agent_name": agent_name,
-                    "has_collaborator": bool(collaborator_name)
-                }
+                metadata=metadata,
+                tags=tags
             )
-            safe_print(f"✅ Rationale: {rationale_text[:100]}...")
+            safe_print(f"✅ Rationale: {truncate_text(rationale_text, 100)}")
     
     def _process_invocation_input(self, orchestration: Dict[str, Any], session_id: str, agent_name: str):
         """Process invocation input from orchestration trace."""
-        if "invocationInput" not in orchestration:
+        invocation_input = orchestration.get("invocationInput")
+        if invocation_input is None:
             return
             
-        invocation_input = orchestration["invocationInput"]
-        invocation_type = invocation_input.get("invocationType", "")
-        
-        if invocation_type == "ACTION_GROUP":
-            self._process_action_group_input(invocation_input, session_id, agent_name)
-        elif invocation_type == "KNOWLEDGE_BASE":
-            self._process_knowledge_base_input(invocation_input, session_id)
-        elif invocation_type == "AGENT_COLLABORATOR":
-            self._process_collaborator_input(invocation_input, session_id)
+        handler = self._invocation_input_handlers.get(invocation_input.get("invocationType", ""))
+        
+        if handler:
+            handler(invocation_input, session_id)
     
-    def _process_action_group_input(self, invocation_input: Dict[str, Any], session_id: str, agent_name: str):
+    def _process_action_group_input(self, invocation_input: Dict[str, Any], session_id: str):
         """Process action group invocation input."""
-        action_input = invocation_input.get("actionGroupInvocationInput", {})
+        action_input = invocation_input.get("actionGroupInvocationInput") or {}
         action_name = action_input.get("actionGroupName", "")
         api_path = action_input.get("apiPath", "")
         verb = action_input.get("verb", "")
         parameters = action_input.get("parameters", [])
         
-        params_str = json.dumps(parameters, indent=2) if parameters else "No parameters"
+        params_str = json_dumps_pretty(parameters) if parameters else "No parameters"
+        
+        metadata = {
+            "action_group_name": action_name,
+            "api_path": api_path,
+            "verb": verb,
+            "parameters_count": len(parameters),
+            "execution_type": action_input.get("executionType", "")
+        }
+        tags = {
+            "trace_type": "action_input",
+            "action_group": action_name,
+            "api_method": verb
+        }
         
         with self.llm_obs.tool(name=f"action-{action_name}", session_id=session_id):
             self.llm_obs.annotate(
                 input_data=f"Calling {verb} {api_path} with parameters: {params_str}",
                 output_data="Action group invocation initiated",
-                metadata={
-                    "action_group_name": action_name,
-                    "api_path": api_path,
-                    "verb": verb,
-                    "parameters_count": len(parameters),
-                    "execution_type": action_input.get("executionType", "")
-                },
-                tags={
-                    "trace_type": "action_input",
-                    "action_group": action_name,
-                    "api_method": verb
-                }
+                metadata=metadata,
+                tags=tags
             )
             safe_print(f"✅ Action Input: {action_name} - {verb} {api_path}")
     
     def _process_knowledge_base_input(self, invocation_input: Dict[str, Any], session_id: str):
         """Process knowledge base invocation input."""
-        kb_input = invocation_input.get("knowledgeBaseLookupInput", {})
+        kb_input = invocation_input.get("knowledgeBaseLookupInput") or {}
         kb_id = kb_input.get("knowledgeBaseId", "")
         query_text = kb_input.get("text", "")
         
+        if not self._should_emit(query_text):
+            return
+        
+        metadata = {
+            "knowledge_base_id": kb_id,
+            "query_length": len(query_text)
+        }
+        tags = {
+            "trace_type": "kb_input",
+            "knowledge_base_id": kb_id
+        }
+        
         with self.llm_obs.retrieval(name="knowledge-base-query", session_id=session_id):
             self.llm_obs.annotate(
                 input_data=query_text,
                 output_data="Knowledge base query initiated",
-                metadata={
-                    "knowledge_base_id": kb_id,
-                    "query_length": len(query_text)
-                },
-                tags={
-                    "trace_type": "kb_input",
-                    "knowledge_base_id": kb_id
-                }
+                metadata=metadata,
+                tags=tags
             )
-            safe_print(f"✅ KB Query: {query_text[:100]}...")
+            safe_print(f"✅ KB Query: {truncate_text(query_text, 100)}")
     
     def _process_collaborator_input(self, invocation_input: Dict[str, Any], session_id: str):
         """Process collaborator invocation input."""
-        collab_input = invocation_input.get("agentCollaboratorInvocationInput", {})
+        collab_input = invocation_input.get("agentCollaboratorInvocationInput") or {}
         collab_name = collab_input.get("agentCollaboratorName", "")
-        input_text = collab_input.get("input", {}).get("text", "")
+        input_text = (collab_input.get("input") or {}).get("text", "")
+        
+        if not self._should_emit(input_text):
+            return
+        
+        metadata = {
+            "collaborator_name": collab_name,
+            "collaborator_arn": collab_input.get("agentCollaboratorAliasArn", ""),
+            "input_length": len(input_text)
+        }
+        tags = {
+            "trace_type": "collaborator_input",
+            "collaborator": collab_name
+        }
         
         with self.llm_obs.agent(name=f"collaborator-{collab_name}", session_id=session_id):
             self.llm_obs.annotate(
                 input_data=input_text,
                 output_data="Collaborator agent invocation initiated",
-                metadata={
-                    "collaborator_name": collab_name,
-                    "collaborator_arn": collab_input.get("agentCollaboratorAliasArn", ""),
-                    "input_length": len(input_text)
-                },
-                tags={
-                    "trace_type": "collaborator_input",
-                    "collaborator": collab_name
-                }
+                metadata=metadata,
+                tags=tags
             )
-            safe_print(f"✅ Collaborator Input: {collab_name} - {input_text[:100]}...")
+            safe_print(f"✅ Collaborator Input: {collab_name} - {truncate_text(input_text, 100)}")
     
     def _process_observation(self, orchestration: Dict[str, Any], session_id: str, agent_name: str):
         """Process observation from orchestration trace."""
-        if "observation" not in orchestration:
+        observation = orchestration.get("observation")
+        if observation is None:
             return
             
-        observation = orchestration["observation"]
-        obs_type = observation.get("type", "")
-        
-        if obs_type == "ACTION_GROUP":
-            self._process_action_group_output(observation, session_id)
-        elif obs_type == "KNOWLEDGE_BASE":
-            self._process_knowledge_base_output(observation, session_id)
-        elif obs_type == "AGENT_COLLABORATOR":
-            self._process_collaborator_output(observation, session_id)
-        elif obs_type == "FINISH":
-            self._process_final_response(observation, session_id)
-        elif obs_type == "REPROMPT":
-            self._process_reprompt(observation, session_id)
+        handler = self._observation_handlers.get(observation.get("type", ""))
+        
+        if handler:
+            handler(observation, session_id)
     
     def _process_action_group_output(self, observation: Dict[str, Any], session_id: str):
         """Process action group output."""
-        action_output = observation.get("actionGroupInvocationOutput", {})
+        action_output = observation.get("actionGroupInvocationOutput") or {}
         response_text = action_output.get("text", "")
         
-        formatted_response = format_response_for_display(response_text)
+        if not self._should_emit(response_text):
+            return
+        
+        # Materialize the string form once; it feeds the formatter, metadata and preview
+        response_str = response_text if isinstance(response_text, str) else str(response_text)
+        
+        formatted_response = format_response_for_display(response_str)
+        
+        metadata = {
+            "response_length": len(response_str),
+            "response_type": "json" if response_str.lstrip()[:1] == '{' else "text"
+        }
+        tags = {
+            "trace_type": "action_output",
+            "has_response": bool(response_text)
+        }
         
         with self.llm_obs.tool(name="action-group-response", session_id=session_id):
             self.llm_obs.annotate(
                 input_data="Action group execution completed",
                 output_data=formatted_response,
-                metadata={
-                    "response_length": len(str(response_text)),
-                    "response_type": "json" if str(response_text).strip().startswith('{') else "text"
-                },
-                tags={
-                    "trace_type": "action_output",
-                    "has_response": bool(response_text)
-                }
+                metadata=metadata,
+                tags=tags
             )
-            safe_print(f"✅ Action Output: {str(response_text)[:200]}...")
+            safe_print(f"✅ Action Output: {truncate_text(response_str, 200)}")
     
     def _process_knowledge_base_output(self, observation: Dict[str, Any], session_id: str):
         """Process knowledge base output."""
-        kb_output = observation.get("knowledgeBaseLookupOutput", {})
-        references = kb_output.get("retrievedReferences", [])
+        kb_output = observation.get("knowledgeBaseLookupOutput") or {}
+        references = kb_output.get("retrievedReferences") or []
         
-        # Extract all reference texts and sources
+        # Extract all reference texts and sources in a single pass
         retrieved_docs = []
+        texts = []
+        sources = []
         for ref in references:
-            text = ref.get("content", {}).get("text", "")
-            source = ref.get("location", {}).get("s3Location", {}).get("uri", "")
-            if text:
-                retrieved_docs.append({
-                    "text": text,
-                    "source": source,
-                    "id": f"doc_{len(retrieved_docs) + 1}"
-                })
+            content = ref.get("content") or {}
+            text = content.get("text", "")
+            if not text:
+                continue
+            source = _reference_source(ref)
+            texts.append(text)
+            sources.append(source)
+            retrieved_docs.append({
+                "text": text,
+                "source": source,
+                "id": f"doc_{len(texts)}"
+            })
+        
+        all_text = "\n\n".join(texts)
         
-        all_text = "\n\n".join([doc["text"] for doc in retrieved_docs])
+        metadata = {
+            "references_count": len(references),
+            "total_content_length": len(all_text),
+            "sources": sources
+        }
+        tags = {
+            "trace_type": "kb_output",
+            "references_found": str(len(references))
+        }
         
         with self.llm_obs.retrieval(name="knowledge-base-retrieval", session_id=session_id):
             self.llm_obs.annotate(
                 input_data="Knowledge base search completed",
                 output_data=retrieved_docs,
-                metadata={
-                    "references_count": len(references),
-                    "total_content_length": len(all_text),
-                    "sources": [doc["source"] for doc in retrieved_docs]
-                },
-                tags={
-                    "trace_type": "kb_output",
-                    "references_found": str(len(references))
-                }
+                metadata=metadata,
+                tags=tags
             )
             safe_print(f"✅ KB Output: {len(references)} references, {len(all_text)} chars")
     
     def _process_collaborator_output(self, observation: Dict[str, Any], session_id: str):
         """Process collaborator output."""
-        collab_output = observation.get("agentCollaboratorInvocationOutput", {})
+        collab_output = observation.get("agentCollaboratorInvocationOutput") or {}
         collab_name = collab_output.get("agentCollaboratorName", "")
-        output_text = collab_output.get("output", {}).get("text", "")
+        output_text = (collab_output.get("output") or {}).get("text", "")
+        
+        if not self._should_emit(output_text):
+            return
+        
+        metadata = {
+            "collaborator_name": collab_name,
+            "response_length": len(output_text)
+        }
+        tags = {
+            "trace_type": "collaborator_output",
+            "collaborator": collab_name
+        }
         
         with self.llm_obs.agent(name=f"collaborator-response-{collab_name}", session_id=session_id):
             self.llm_obs.annotate(
                 input_data=f"Response from {collab_name}",
                 output_data=output_text,
-                metadata={
-                    "collaborator_name": collab_name,
-                    "response_length": len(output_text)
-                },
-                tags={
-                    "trace_type": "collaborator_output",
-                    "collaborator": collab_name
-                }
+                metadata=metadata,
+                tags=tags
             )
-            safe_print(f"✅ Collaborator Output: {collab_name} - {output_text[:100]}...")
+            safe_print(f"✅ Collaborator Output: {collab_name} - {truncate_text(output_text, 100)}")
     
     def _process_final_response(self, observation: Dict[str, Any], session_id: str):
         """Process final response."""
-        final_response = observation.get("finalResponse", {})
+        final_response = observation.get("finalResponse") or {}
         final_text = final_response.get("text", "")
         
+        if not self._should_emit(final_text):
+            return
+        
+        metadata = {
+            "is_final": True,
+            "response_length": len(final_text)
+        }
+        tags = {
+            "trace_type": "final_response",
+            "is_complete": "true"
+        }
+        
         with self.llm_obs.llm(name="final-response-generator", model_name="bedrock-agent", 
                              model_provider="aws", session_id=session_id):
             self.llm_obs.annotate(
                 input_data=[{"role": "system", "content": "Generate final response to user"}],
                 output_data=[{"role": "assistant", "content": final_text}],
-                metadata={
-                    "is_final": True,
-                    "response_length": len(final_text)
-                },
-                tags={
-                    "trace_type": "final_response",
-                    "is_complete": "true"
-                }
+                metadata=metadata,
+                tags=tags
             )
-            safe_print(f"✅ Final Response: {final_text[:200]}...")
+            safe_print(f"✅ Final Response: {truncate_text(final_text, 200)}")
     
     def _process_reprompt(self, observation: Dict[str, Any], session_id: str):
         """Process reprompt response."""
-        reprompt = observation.get("repromptResponse", {})
+        reprompt = observation.get("repromptResponse") or {}
         reprompt_text = reprompt.get("text", "")
         reprompt_source = reprompt.get("source", "")
         
+        if not self._should_emit(reprompt_text):
+            return
+        
+        metadata = {
+            "reprompt_source": reprompt_source,
+            "requires_clarification": True
+        }
+        tags = {
+            "trace_type": "reprompt",
+            "source": reprompt_source
+        }
+        
         with self.llm_obs.agent(name="clarification-agent", session_id=session_id):
             self.llm_obs.annotate(
                 input_data=f"Reprompt needed from {reprompt_source}",
                 output_data=reprompt_text,
-                metadata={
-                    "reprompt_source": reprompt_source,
-                    "requires_clarification": True
-                },
-                tags={
-                    "trace_type": "reprompt",
-                    "source": reprompt_source
-                }
+                metadata=metadata,
+                tags=tags
             )
-            safe_print(f"✅ Reprompt: {reprompt_text[:100]}...")
+            safe_print(f"✅ Reprompt: {truncate_text(reprompt_text, 100)}")
     
-    def _process_postprocessing_trace(self, trace_data: Dict[str, Any], session_id: str, agent_name: str):
+    def _process_postprocessing_trace(self, postprocessing: Dict[str, Any], session_id: str,
+                                      agent_id: str, agent_name: str, collaborator_name: str):
         """Process PostProcessingTrace events."""
-        if "postProcessingTrace" not in trace_data:
-            return
-            
-        postprocessing = trace_data["postProcessingTrace"]
-        model_input = postprocessing.get("modelInvocationInput", {})
-        model_output = postprocessing.get("modelInvocationOutput", {})
+        model_input = postprocessing.get("modelInvocationInput") or {}
+        model_output = postprocessing.get("modelInvocationOutput") or {}
+        parsed_response = model_output.get("parsedResponse") or {}
         
         input_text = model_input.get("text", "")
-        output_text = model_output.get("parsedResponse", {}).get("text", "")
+        output_text = parsed_response.get("text", "")
+        
+        if not self._should_emit(output_text):
+            return
+        
+        metadata = {
+            "step": "postprocessing",
+            "foundation_model": model_input.get("foundationModel", ""),
+            "usage": (model_output.get("metadata") or {}).get("usage") or {}
+        }
+        tags = {
+            "trace_type": "postprocessing",
+            "agent_name": agent_name
+        }
         
         with self.llm_obs.task(name="response-postprocessing", session_id=session_id):
             self.llm_obs.annotate(
                 input_data=input_text,
                 output_data=output_text,
-                metadata={
-                    "step": "postprocessing",
-                    "foundation_model": model_input.get("foundationModel", ""),
-                    "usage": model_output.get("metadata", {}).get("usage", {})
-                },
-                tags={
-                    "trace_type": "postprocessing",
-                    "agent_name": agent_name
-                }
+                metadata=metadata,
+                tags=tags
             )
-            safe_print(f"✅ Postprocessing: {output_text[:100]}...")
+            safe_print(f"✅ Postprocessing: {truncate_text(output_text, 100)}")
     
-    def _process_guardrail_trace(self, trace_data: Dict[str, Any], session_id: str):
+    def _process_guardrail_trace(self, guardrail: Dict[str, Any], session_id: str,
+                                 agent_id: str, agent_name: str, collaborator_name: str):
         """Process GuardrailTrace events."""
-        if "guardrailTrace" not in trace_data:
-            return
-            
-        guardrail = trace_data["guardrailTrace"]
         action = guardrail.get("action", "")
         
+        metadata = {
+            "guardrail_action": action,
+            "intervention": action == "GUARDRAIL_INTERVENED",
+            "input_assessments": len(guardrail.get("inputAssessments", [])),
+            "output_assessments": len(guardrail.get("outputAssessments", []))
+        }
+        tags = {
+            "trace_type": "guardrail",
+            "action": action
+        }
+        
         with self.llm_obs.task(name="guardrail-assessment", session_id=session_id):
             self.llm_obs.annotate(
                 input_data="Guardrail safety assessment",
                 output_data=f"Action taken: {action}",
-                metadata={
-                    "guardrail_action": action,
-                    "intervention": action == "GUARDRAIL_INTERVENED",
-                    "input_assessments": len(guardrail.get("inputAssessments", [])),
-                    "output_assessments": len(guardrail.get("outputAssessments", []))
-                },
-                tags={
-                    "trace_type": "guardrail",
-                    "action": action
-                }
+                metadata=metadata,
+                tags=tags
             )
             safe_print(f"✅ Guardrail: {action}")
     
-    def _process_failure_trace(self, trace_data: Dict[str, Any], session_id: str):
+    def _process_failure_trace(self, failure: Dict[str, Any], session_id: str,
+                               agent_id: str, agent_name: str, collaborator_name: str):
         """Process FailureTrace events."""
-        if "failureTrace" not in trace_data:
-            return
-            
-        failure = trace_data["failureTrace"]
         failure_reason = failure.get("failureReason", "")
         
+        metadata = {
+            "failed": True,
+            "failure_reason": failure_reason
+        }
+        tags = {
+            "trace_type": "failure",
+            "error": "true"
+        }
+        
         with self.llm_obs.task(name="error-handler", session_id=session_id):
             self.llm_obs.annotate(
                 input_data="Processing failed",
                 output_data=f"Failure: {failure_reason}",
-                metadata={
-                    "failed": True,
-                    "failure_reason": failure_reason
-                },
-                tags={
-                    "trace_type": "failure",
-                    "error": "true"
-                }
+                metadata=metadata,
+                tags=tags
             )
             safe_print(f"❌ Failure: {failure_reason}") 
\ No newline at end of file
@@ -4,10 +4,11 @@ Allows running different question sets for evaluation purposes.
 """
 
 import json
-import os
 import sys
+from config import AppConfig
 from runners.test_runner import TestRunner
 from utils.logger import setup_logging
+from utils.file_utils import load_json_file, list_question_files
 
 def load_evaluation_questions(file_path: str):
     """
@@ -20,8 +21,7 @@ def load_evaluation_questions(file_path: str):
         List of question dictionaries
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            questions = json.load(f)
+        questions = list(load_json_file(file_path))
         print(f"✅ Loaded {len(questions)} questions from {file_path}")
         return questions
     except FileNotFoundError:
@@ -33,16 +33,7 @@ def load_evaluation_questions(file_path: str):
 
 def get_available_question_files():
     """Get list of available question files in the data directory."""
-    data_dir = "data"
-    if not os.path.exists(data_dir):
-        return []
-    
-    question_files = []
-    for file in os.listdir(data_dir):
-        if file.endswith('.json') and 'question' in file.lower():
-            question_files.append(os.path.join(data_dir, file))
-    
-    return sorted(question_files)
+    return sorted(list_question_files("data"))
 
 def show_available_files():
     """Show available question files with numbers."""
@@ -56,9 +47,7 @@ def show_available_files():
     for i, file_path in enumerate(available_files, 1):
         # Try to get question count
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                questions = json.load(f)
-                count = len(questions)
+            count = len(load_json_file(file_path))
         except:
             count = "unknown"
         
@@ -117,9 +106,13 @@ def interactive_mode():
             if 0 <= file_index < len(available_files):
                 selected_file = available_files[file_index]
                 
-                # Ask for delay
-                delay_input = input("Delay between tests (default 3 seconds): ").strip()
-                delay = int(delay_input) if delay_input.isdigit() else 3
+                # Ask for delay; concurrent runs don't pause between tests
+                if AppConfig.MAX_WORKERS > 1:
+                    print(f"ℹ️  Running with MAX_WORKERS={AppConfig.MAX_WORKERS}, no delay between tests")
+                    delay = 0
+                else:
+                    delay_input = input("Delay between tests (default 3 seconds): ").strip()
+                    delay = int(delay_input) if delay_input.isdigit() else 3
                 
                 return run_evaluation(selected_file, delay)
             else:
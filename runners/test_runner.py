@@ -4,12 +4,15 @@ Handles test execution, result collection, and reporting.
 """
 
 import time
-from typing import List, Dict, Any
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, BinaryIO
 from orchestrators.agent_orchestrator import AgentOrchestrator
 from models.question import Question
 from models.test_result import TestResult
-from utils.logger import safe_print, get_logger
-from config import DatadogConfig
+from utils.logger import safe_print, set_print_prefix, get_logger
+from utils.text_processing import json_dumps_line, truncate_text
+from config import DatadogConfig, AppConfig
 
 logger = get_logger(__name__)
 
@@ -21,13 +24,19 @@ class TestRunner:
         self.orchestrator = AgentOrchestrator()
         self.results: List[TestResult] = []
     
-    def run_test_suite(self, questions: List[Dict[str, Any]], delay_between_tests: int = 3) -> List[TestResult]:
+    def run_test_suite(self, questions: List[Dict[str, Any]], delay_between_tests: int = 3,
+                       results_file: Optional[str] = None) -> List[TestResult]:
         """
         Run a complete test suite with the given questions.
         
+        Tests run concurrently when AppConfig.MAX_WORKERS is greater than 1.
+        
         Args:
             questions: List of question dictionaries
-            delay_between_tests: Delay in seconds between tests
+            delay_between_tests: Delay in seconds between tests (sequential runs only)
+            results_file: JSON Lines file, truncated at the start of the run, that each
+                result is written to as soon as it completes (defaults to
+                AppConfig.RESULTS_FILE; empty disables)
             
         Returns:
             List of test results
@@ -35,25 +44,66 @@ class TestRunner:
         self._print_test_suite_header()
         
         total_calls = len(questions)
-        successful_calls = 0
+        # Read only from config so the Bedrock connection pool is sized to match
+        workers = AppConfig.MAX_WORKERS
+        output_path = results_file if results_file is not None else AppConfig.RESULTS_FILE
+        
+        # Open once per run so results from earlier runs are not mixed in
+        with (open(output_path, 'wb') if output_path else nullcontext()) as results_handle:
+            if workers > 1:
+                suite_results = self._run_concurrent(questions, workers, results_handle)
+            else:
+                suite_results = self._run_sequential(questions, delay_between_tests, results_handle)
+        
+        self.results.extend(suite_results)
+        successful_calls = sum(1 for result in suite_results if result.success)
+        
+        self._print_test_suite_summary(successful_calls, total_calls)
+        return self.results
+    
+    def _run_sequential(self, questions: List[Dict[str, Any]], delay_between_tests: int,
+                        results_handle: Optional[BinaryIO]) -> List[TestResult]:
+        """Run tests one after another, pausing between them."""
+        total_calls = len(questions)
+        suite_results = []
         
         for i, question_data in enumerate(questions, 1):
             question = Question.from_dict(question_data)
             result = self._run_single_test(question, i, total_calls)
-            
-            if result.success:
-                successful_calls += 1
-            
-            self.results.append(result)
+            self._write_result(result, results_handle)
+            suite_results.append(result)
             
             # Add delay between tests (except for the last one)
             if i < total_calls:
                 time.sleep(delay_between_tests)
         
-        self._print_test_suite_summary(successful_calls, total_calls)
-        return self.results
+        return suite_results
     
-    def _run_single_test(self, question: Question, test_number: int, total_tests: int) -> TestResult:
+    def _run_concurrent(self, questions: List[Dict[str, Any]], max_workers: int,
+                        results_handle: Optional[BinaryIO]) -> List[TestResult]:
+        """Run tests on a thread pool, returning results in question order."""
+        total_calls = len(questions)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._run_single_test, Question.from_dict(question_data), i, total_calls, True)
+                for i, question_data in enumerate(questions, 1)
+            ]
+            # Write results in completion order so a crash keeps everything finished so far
+            for future in as_completed(futures):
+                self._write_result(future.result(), results_handle)
+            return [future.result() for future in futures]
+    
+    def _write_result(self, result: TestResult, results_handle: Optional[BinaryIO]):
+        """Write a single result to the JSON Lines results file, if one is open."""
+        if results_handle is None:
+            return
+        results_handle.write(json_dumps_line(result.to_dict()))
+        # Flush per line so a crash keeps every result written so far
+        results_handle.flush()
+    
+    def _run_single_test(self, question: Question, test_number: int, total_tests: int,
+                         tag_output: bool = False) -> TestResult:
         """
         Run a single test with the given question.
         
@@ -61,6 +111,7 @@ class TestRunner:
             question: Question to test
             test_number: Current test number
             total_tests: Total number of tests
+            tag_output: Prefix progress lines with the test number (for concurrent runs)
             
         Returns:
             Test result
@@ -70,14 +121,19 @@ class TestRunner:
         start_time = time.time()
         
         try:
-            response = self.orchestrator.ask_agent_with_traces(question.question, question.expected)
+            if tag_output:
+                set_print_prefix(f"[Test {test_number}/{total_tests}] ")
+            try:
+                response = self.orchestrator.ask_agent_with_traces(question.question, question.expected)
+            finally:
+                set_print_prefix()
             end_time = time.time()
             duration = end_time - start_time
             
             success = response is not None
             error_message = None if success else "No response received"
             
-            self._print_test_result(success, duration, response)
+            self._print_test_result(test_number, total_tests, success, duration, response)
             
             return TestResult(
                 question=question.question,
@@ -93,7 +149,7 @@ class TestRunner:
             duration = end_time - start_time
             
             logger.error(f"Test failed with exception: {e}")
-            self._print_test_result(False, duration, None, str(e))
+            self._print_test_result(test_number, total_tests, False, duration, None, str(e))
             
             return TestResult(
                 question=question.question,
@@ -119,22 +175,30 @@ class TestRunner:
     
     def _print_test_header(self, question: Question, test_number: int, total_tests: int):
         """Print header for individual test."""
-        print(f"\n{'='*20} Test {test_number}/{total_tests} {'='*20}")
-        print(f"❓ Question: {question.question}")
-        print(f"📋 Expected: {question.expected}")
-        print("-" * 60)
+        # One safe_print call, so concurrent tests can't interleave inside the block
+        safe_print("\n".join([
+            f"\n{'='*20} Test {test_number}/{total_tests} {'='*20}",
+            f"❓ Question: {question.question}",
+            f"📋 Expected: {question.expected}",
+            "-" * 60
+        ]))
     
-    def _print_test_result(self, success: bool, duration: float, response: str, error: str = None):
+    def _print_test_result(self, test_number: int, total_tests: int, success: bool,
+                           duration: float, response: str, error: str = None):
         """Print result for individual test."""
+        # Tagged with the test number, since concurrent results arrive in completion order
         if success:
-            print(f"✅ SUCCESS - Duration: {duration:.2f}s")
-            print(f"📤 Response: {response[:200]}{'...' if len(response) > 200 else ''}")
+            lines = [
+                f"✅ Test {test_number}/{total_tests} SUCCESS - Duration: {duration:.2f}s",
+                f"📤 Response: {truncate_text(response, 200)}"
+            ]
         else:
-            print(f"❌ FAILED - Duration: {duration:.2f}s")
+            lines = [f"❌ Test {test_number}/{total_tests} FAILED - Duration: {duration:.2f}s"]
             if error:
-                print(f"📤 Error: {error}")
+                lines.append(f"📤 Error: {error}")
             else:
-                print("📤 No response received")
+                lines.append("📤 No response received")
+        safe_print("\n".join(lines))
     
     def _print_test_suite_summary(self, successful_calls: int, total_calls: int):
         """Print summary of test suite execution."""
@@ -147,6 +211,10 @@ class TestRunner:
     
     def flush_data_to_datadog(self) -> bool:
         """Flush all data to Datadog and print results."""
+        if not self.orchestrator.is_tracing_enabled():
+            print("\nℹ️  LLM Observability disabled, nothing flushed")
+            return False
+        
         print("\n🔄 Flushing LLM Observability data to Datadog...")
         
         success = self.orchestrator.flush_data()
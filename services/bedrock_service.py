@@ -3,8 +3,8 @@ Bedrock service module for AWS Bedrock operations.
 Handles Bedrock client initialization and agent interactions.
 """
 
-import boto3
-from config import BedrockConfig
+import threading
+from config import BedrockConfig, AppConfig
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,12 +13,34 @@ class BedrockService:
     """Service class for AWS Bedrock operations."""
     
     def __init__(self):
-        """Initialize Bedrock service with client."""
-        self.client = boto3.client(
-            "bedrock-agent-runtime", 
-            region_name=BedrockConfig.REGION
-        )
-        logger.info(f"Bedrock client initialized for region: {BedrockConfig.REGION}")
+        """Initialize Bedrock service; the client is created on first use."""
+        self._client = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def client(self):
+        """Bedrock agent runtime client, created lazily on first access."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    # boto3 is slow to import; defer it until a client is actually needed
+                    import boto3
+                    from botocore.config import Config
+                    
+                    self._client = boto3.client(
+                        "bedrock-agent-runtime", 
+                        region_name=BedrockConfig.REGION,
+                        config=Config(
+                            # One pooled connection per concurrent test; botocore defaults to 10
+                            max_pool_connections=max(10, AppConfig.MAX_WORKERS),
+                            # Keep idle pooled connections alive between questions
+                            tcp_keepalive=True,
+                            # Adaptive mode rate-limits client-side when Bedrock throttles
+                            retries={"max_attempts": AppConfig.MAX_RETRIES, "mode": "adaptive"}
+                        )
+                    )
+                    logger.info(f"Bedrock client initialized for region: {BedrockConfig.REGION}")
+        return self._client
     
     def invoke_agent(self, question: str, session_id: str) -> dict:
         """
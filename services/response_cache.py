@@ -0,0 +1,81 @@
+"""
+Response cache module for replaying Bedrock agent invocations.
+Stores agent output and trace events on disk so repeated questions skip the agent call.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+from config import BedrockConfig
+from utils.logger import get_logger
+from utils.text_processing import json_loads, json_dumps_line
+
+logger = get_logger(__name__)
+
+class ResponseCache:
+    """File-backed cache of agent responses, keyed by question and agent."""
+    
+    def __init__(self, cache_dir: str = BedrockConfig.CACHE_DIR):
+        """Initialize the cache rooted at the given directory."""
+        self.cache_dir = cache_dir
+    
+    def _path_for(self, question: str) -> str:
+        """Get the cache file path for a question against the configured agent."""
+        key = hashlib.sha256(
+            f"{question}|{BedrockConfig.AGENT_ID}|{BedrockConfig.AGENT_ALIAS_ID}".encode('utf-8')
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, question: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            question: The question asked to the agent
+        
+        Returns:
+            Dict with "output" and "trace_events", or None on a miss
+        """
+        try:
+            with open(self._path_for(question), 'rb') as f:
+                return json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for question: {e}")
+            return None
+    
+    def set(self, question: str, output: str, trace_events: List[Dict[str, Any]]):
+        """
+        Store an agent response.
+        
+        Args:
+            question: The question asked to the agent
+            output: Final agent output text
+            trace_events: Raw trace payloads received for the question
+        """
+        try:
+            # Trace payloads may carry values the encoder can't handle; store them as strings
+            payload = json_dumps_line({"output": output, "trace_events": trace_events}, default=str)
+            
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temp file and rename so concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self._path_for(question))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            # A cache write must never fail the test itself
+            logger.warning(f"Failed to write cache entry: {e}")
+    
+    @staticmethod
+    def replay_events(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Rebuild completion stream events from a cache entry."""
+        events = [{"trace": trace} for trace in entry.get("trace_events", [])]
+        events.append({"chunk": {"bytes": entry.get("output", "").encode('utf-8')}})
+        return events
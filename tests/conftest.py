@@ -0,0 +1,67 @@
+"""
+Shared fixtures for the test suite.
+External services are replaced with in-process fakes; no AWS or Datadog calls are made.
+"""
+
+import pytest
+from config import DatadogConfig
+from orchestrators.agent_orchestrator import AgentOrchestrator
+from runners.test_runner import TestRunner
+from services.response_cache import ResponseCache
+
+class FakeBedrockService:
+    """Stand-in for BedrockService that returns a canned completion stream."""
+    
+    def __init__(self):
+        """Initialize with an empty stream and no recorded calls."""
+        self.events = []
+        self.calls = []
+    
+    def invoke_agent(self, question, session_id):
+        """Record the call and return the configured events."""
+        self.calls.append((question, session_id))
+        return {"completion": list(self.events)}
+    
+    def get_agent_info(self):
+        """Get a fixed agent description."""
+        return {"agent_id": "test-agent", "agent_alias_id": "test-alias", "region": "eu-west-1"}
+
+def chunk_event(text):
+    """Build a completion chunk event carrying the given text."""
+    return {"chunk": {"bytes": text.encode('utf-8')}}
+
+def trace_event(trace):
+    """Build a completion trace event wrapping the given trace body."""
+    return {"trace": {"agentId": "test-agent", "agentName": "supervisor", "trace": trace}}
+
+@pytest.fixture(autouse=True)
+def llm_obs_disabled(monkeypatch):
+    """Keep LLM Observability disabled so ddtrace is never imported."""
+    monkeypatch.setattr(DatadogConfig, "API_KEY", "")
+
+@pytest.fixture
+def fake_bedrock():
+    """Fake Bedrock service with an empty completion stream."""
+    return FakeBedrockService()
+
+@pytest.fixture
+def orchestrator(fake_bedrock):
+    """Orchestrator wired to the fake Bedrock service, with the response cache off."""
+    orch = AgentOrchestrator()
+    orch.bedrock_service = fake_bedrock
+    orch.response_cache = None
+    return orch
+
+@pytest.fixture
+def response_cache(tmp_path):
+    """Response cache rooted in a temporary directory."""
+    return ResponseCache(str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def runner(fake_bedrock):
+    """Test runner whose orchestrator uses the fake Bedrock service."""
+    test_runner = TestRunner()
+    test_runner.orchestrator.bedrock_service = fake_bedrock
+    test_runner.orchestrator.response_cache = None
+    return test_runner
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""Tests for the agent orchestrator's event loop and response caching."""
+
+from tests.conftest import chunk_event, trace_event
+
+def test_returns_joined_chunk_output(orchestrator, fake_bedrock):
+    fake_bedrock.events = [chunk_event("Hello, "), chunk_event("world ")]
+    
+    assert orchestrator.ask_agent_with_traces("question") == "Hello, world"
+
+def test_returns_none_without_output(orchestrator, fake_bedrock):
+    fake_bedrock.events = []
+    
+    assert orchestrator.ask_agent_with_traces("question") is None
+
+def test_successful_response_is_replayed_from_cache(orchestrator, fake_bedrock, response_cache):
+    orchestrator.response_cache = response_cache
+    fake_bedrock.events = [
+        trace_event({"orchestrationTrace": {"rationale": {"text": "thinking"}}}),
+        chunk_event("answer"),
+    ]
+    
+    first = orchestrator.ask_agent_with_traces("question")
+    second = orchestrator.ask_agent_with_traces("question")
+    
+    assert first == second == "answer"
+    assert len(fake_bedrock.calls) == 1
+
+def test_empty_response_is_not_cached(orchestrator, fake_bedrock, response_cache):
+    orchestrator.response_cache = response_cache
+    fake_bedrock.events = []
+    
+    orchestrator.ask_agent_with_traces("question")
+    
+    assert response_cache.get("question") is None
+
+def test_failed_response_is_not_cached(orchestrator, fake_bedrock, response_cache):
+    orchestrator.response_cache = response_cache
+    fake_bedrock.events = [
+        trace_event({"failureTrace": {"failureReason": "throttled"}}),
+        chunk_event("partial answer"),
+    ]
+    
+    orchestrator.ask_agent_with_traces("question")
+    
+    assert response_cache.get("question") is None
+
+def test_invoke_error_returns_none(orchestrator, fake_bedrock):
+    def fail(question, session_id):
+        raise RuntimeError("boom")
+    fake_bedrock.invoke_agent = fail
+    
+    assert orchestrator.ask_agent_with_traces("question") is None
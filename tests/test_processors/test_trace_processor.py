@@ -0,0 +1,74 @@
+"""Tests for trace event dispatch and empty-span gating."""
+
+from contextlib import nullcontext
+import pytest
+from config import DatadogConfig
+from processors.trace_processor import TraceProcessor
+
+class RecordingLLMObs:
+    """LLMObs stand-in that records the spans opened on it."""
+    
+    def __init__(self):
+        """Initialize with no recorded spans."""
+        self.spans = []
+    
+    def _span(self, kind):
+        def open_span(name=None, **kwargs):
+            self.spans.append((kind, name))
+            return nullcontext()
+        return open_span
+    
+    def __getattr__(self, kind):
+        if kind in ("workflow", "agent", "task", "tool", "retrieval", "llm"):
+            return self._span(kind)
+        raise AttributeError(kind)
+    
+    def annotate(self, **kwargs):
+        pass
+
+def orchestration(**fields):
+    return {"orchestrationTrace": fields}
+
+EMPTY_TRACES = {
+    "rationale": orchestration(rationale={"text": ""}),
+    "knowledge_base_input": orchestration(invocationInput={
+        "invocationType": "KNOWLEDGE_BASE",
+        "knowledgeBaseLookupInput": {"knowledgeBaseId": "kb", "text": ""}
+    }),
+    "final_response": orchestration(observation={"type": "FINISH", "finalResponse": {"text": ""}}),
+    "postprocessing": {"postProcessingTrace": {"modelInvocationOutput": {"parsedResponse": {"text": ""}}}},
+}
+
+@pytest.fixture
+def llm_obs():
+    return RecordingLLMObs()
+
+@pytest.fixture
+def processor(llm_obs):
+    return TraceProcessor(llm_obs)
+
+def process(processor, trace):
+    processor.process_trace_event({"agentId": "a", "agentName": "supervisor", "trace": trace}, "session")
+
+@pytest.mark.parametrize("trace", EMPTY_TRACES.values(), ids=EMPTY_TRACES.keys())
+def test_empty_content_emits_no_span_by_default(processor, llm_obs, monkeypatch, trace):
+    monkeypatch.setattr(DatadogConfig, "EMIT_EMPTY_SPANS", False)
+    
+    process(processor, trace)
+    
+    assert llm_obs.spans == []
+
+@pytest.mark.parametrize("trace", EMPTY_TRACES.values(), ids=EMPTY_TRACES.keys())
+def test_empty_content_emits_span_when_enabled(processor, llm_obs, monkeypatch, trace):
+    monkeypatch.setattr(DatadogConfig, "EMIT_EMPTY_SPANS", True)
+    
+    process(processor, trace)
+    
+    assert len(llm_obs.spans) == 1
+
+def test_non_empty_content_always_emits_span(processor, llm_obs, monkeypatch):
+    monkeypatch.setattr(DatadogConfig, "EMIT_EMPTY_SPANS", False)
+    
+    process(processor, orchestration(rationale={"text": "thinking"}))
+    
+    assert llm_obs.spans == [("agent", "reasoning-agent-supervisor")]
@@ -0,0 +1,108 @@
+"""Tests for the test suite runner."""
+
+import json
+import threading
+import time
+from config import AppConfig
+from tests.conftest import chunk_event
+
+QUESTIONS = [{"question": f"question {i}", "expected": f"expected {i}"} for i in range(1, 4)]
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def test_results_file_gets_one_line_per_test(runner, fake_bedrock, monkeypatch, tmp_path):
+    monkeypatch.setattr(AppConfig, "MAX_WORKERS", 1)
+    fake_bedrock.events = [chunk_event("answer")]
+    results_file = tmp_path / "results.jsonl"
+    
+    runner.run_test_suite(QUESTIONS, delay_between_tests=0, results_file=str(results_file))
+    
+    lines = read_lines(results_file)
+    assert [line["question"] for line in lines] == [q["question"] for q in QUESTIONS]
+    assert all(line["success"] and line["response"] == "answer" for line in lines)
+
+def test_results_file_is_truncated_on_each_run(runner, fake_bedrock, monkeypatch, tmp_path):
+    monkeypatch.setattr(AppConfig, "MAX_WORKERS", 1)
+    fake_bedrock.events = [chunk_event("answer")]
+    results_file = tmp_path / "results.jsonl"
+    results_file.write_text('{"stale": true}\n')
+    
+    runner.run_test_suite(QUESTIONS[:1], delay_between_tests=0, results_file=str(results_file))
+    runner.run_test_suite(QUESTIONS[1:2], delay_between_tests=0, results_file=str(results_file))
+    
+    lines = read_lines(results_file)
+    assert [line["question"] for line in lines] == ["question 2"]
+
+def test_empty_results_file_disables_writing(runner, fake_bedrock, monkeypatch, tmp_path):
+    monkeypatch.setattr(AppConfig, "MAX_WORKERS", 1)
+    monkeypatch.chdir(tmp_path)
+    
+    runner.run_test_suite(QUESTIONS[:1], delay_between_tests=0, results_file="")
+    
+    assert list(tmp_path.iterdir()) == []
+
+def test_failed_test_is_written_as_failure(runner, fake_bedrock, monkeypatch, tmp_path):
+    monkeypatch.setattr(AppConfig, "MAX_WORKERS", 1)
+    fake_bedrock.events = []
+    results_file = tmp_path / "results.jsonl"
+    
+    runner.run_test_suite(QUESTIONS[:1], delay_between_tests=0, results_file=str(results_file))
+    
+    [line] = read_lines(results_file)
+    assert line["success"] is False
+    assert line["error_message"] == "No response received"
+
+
+def test_concurrent_run_returns_results_in_question_order(runner, fake_bedrock, monkeypatch, tmp_path):
+    monkeypatch.setattr(AppConfig, "MAX_WORKERS", 3)
+    # Every test must be in flight at once to pass the barrier; later questions finish first
+    barrier = threading.Barrier(3, timeout=5)
+    delays = {"question 1": 0.2, "question 2": 0.1, "question 3": 0.0}
+    def invoke_agent(question, session_id):
+        barrier.wait()
+        time.sleep(delays[question])
+        return {"completion": [chunk_event(f"answer to {question}")]}
+    fake_bedrock.invoke_agent = invoke_agent
+    results_file = tmp_path / "results.jsonl"
+    
+    results = runner.run_test_suite(QUESTIONS, delay_between_tests=0, results_file=str(results_file))
+    
+    assert [result.response for result in results] == [f"answer to {q['question']}" for q in QUESTIONS]
+    assert all(result.success for result in results)
+    # The results file is written in completion order
+    assert [line["question"] for line in read_lines(results_file)] == ["question 3", "question 2", "question 1"]
+
+def test_sequential_run_sleeps_between_tests(runner, fake_bedrock, monkeypatch):
+    monkeypatch.setattr(AppConfig, "MAX_WORKERS", 1)
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    fake_bedrock.events = [chunk_event("answer")]
+    
+    results = runner.run_test_suite(QUESTIONS, delay_between_tests=2, results_file="")
+    
+    assert [result.question for result in results] == [q["question"] for q in QUESTIONS]
+    assert sleeps == [2, 2]
+
+def test_concurrent_progress_lines_are_tagged(runner, fake_bedrock, monkeypatch, capsys):
+    monkeypatch.setattr(AppConfig, "MAX_WORKERS", 3)
+    fake_bedrock.invoke_agent = lambda question, session_id: {"completion": [chunk_event(question)]}
+    
+    runner.run_test_suite(QUESTIONS, delay_between_tests=0, results_file="")
+    
+    chunk_lines = [line for line in capsys.readouterr().out.splitlines() if "📝 Chunk" in line]
+    assert len(chunk_lines) == 3
+    for line in chunk_lines:
+        # The tag must name the test whose chunk is printed
+        test_number = line.rsplit(" ", 1)[-1]
+        assert line.startswith(f"[Test {test_number}/3] ")
+
+def test_sequential_progress_lines_are_not_tagged(runner, fake_bedrock, monkeypatch, capsys):
+    monkeypatch.setattr(AppConfig, "MAX_WORKERS", 1)
+    fake_bedrock.events = [chunk_event("answer")]
+    
+    runner.run_test_suite(QUESTIONS[:1], delay_between_tests=0, results_file="")
+    
+    chunk_lines = [line for line in capsys.readouterr().out.splitlines() if "📝 Chunk" in line]
+    assert chunk_lines == ["📝 Chunk 1: answer"]
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""Tests for the Datadog service when no API key is configured."""
+
+import sys
+from services.datadog_service import DatadogService, _NoopLLMObs
+
+def test_missing_api_key_uses_noop_llm_obs():
+    service = DatadogService()
+    
+    assert service.enabled is False
+    assert service.get_llm_obs() is _NoopLLMObs
+    assert "ddtrace" not in sys.modules
+
+def test_noop_spans_are_context_managers():
+    llm_obs = _NoopLLMObs
+    
+    with llm_obs.workflow(name="workflow", session_id="s"):
+        with llm_obs.llm(name="llm", model_name="m", model_provider="aws", session_id="s"):
+            llm_obs.annotate(input_data="in", output_data="out", metadata={}, tags={})
+
+def test_flush_data_reports_nothing_flushed():
+    assert DatadogService().flush_data() is False
+
+def test_runner_reports_disabled_tracing(runner, capsys):
+    assert runner.flush_data_to_datadog() is False
+    
+    out = capsys.readouterr().out
+    assert "LLM Observability disabled, nothing flushed" in out
+    assert "successfully flushed" not in out
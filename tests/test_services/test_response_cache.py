@@ -0,0 +1,66 @@
+"""Tests for the on-disk agent response cache."""
+
+import os
+import services.response_cache as response_cache_module
+from services.response_cache import ResponseCache
+
+def test_get_returns_none_on_miss(response_cache):
+    assert response_cache.get("unknown question") is None
+
+def test_set_then_get_round_trips(response_cache):
+    traces = [{"agentId": "a", "trace": {"orchestrationTrace": {}}}]
+    
+    response_cache.set("question", "שלום", traces)
+    
+    assert response_cache.get("question") == {"output": "שלום", "trace_events": traces}
+
+def test_set_overwrites_previous_entry(response_cache):
+    response_cache.set("question", "first", [])
+    
+    response_cache.set("question", "second", [])
+    
+    assert response_cache.get("question")["output"] == "second"
+
+def test_set_leaves_no_temp_files(response_cache):
+    response_cache.set("question", "answer", [])
+    
+    files = os.listdir(response_cache.cache_dir)
+    assert len(files) == 1
+    assert files[0].endswith(".json")
+
+def test_set_swallows_serialization_errors(response_cache, monkeypatch):
+    def fail(*args, **kwargs):
+        raise TypeError("not serializable")
+    monkeypatch.setattr(response_cache_module, "json_dumps_line", fail)
+    
+    response_cache.set("question", "answer", [])
+    
+    assert response_cache.get("question") is None
+
+def test_set_swallows_io_errors(tmp_path):
+    # A regular file where the cache directory should be makes every write fail
+    blocker = tmp_path / "cache"
+    blocker.write_text("")
+    cache = ResponseCache(str(blocker))
+    
+    cache.set("question", "answer", [])
+    
+    assert cache.get("question") is None
+
+def test_get_ignores_corrupt_entry(response_cache):
+    response_cache.set("question", "answer", [])
+    with open(response_cache._path_for("question"), 'wb') as f:
+        f.write(b"{not json")
+    
+    assert response_cache.get("question") is None
+
+def test_replay_events_puts_output_after_traces():
+    entry = {"output": "answer", "trace_events": [{"id": 1}, {"id": 2}]}
+    
+    events = ResponseCache.replay_events(entry)
+    
+    assert events == [
+        {"trace": {"id": 1}},
+        {"trace": {"id": 2}},
+        {"chunk": {"bytes": b"answer"}},
+    ]
@@ -0,0 +1,58 @@
+"""Tests for the cached JSON loader and question file discovery."""
+
+import os
+import pytest
+from utils.file_utils import _read_json_file, load_json_file, list_question_files
+
+@pytest.fixture(autouse=True)
+def clear_json_cache():
+    _read_json_file.cache_clear()
+    yield
+    _read_json_file.cache_clear()
+
+def write(path, text, mtime_ns):
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def test_unchanged_file_returns_shared_object(tmp_path):
+    path = tmp_path / "questions.json"
+    write(path, '[{"question": "a"}]', 1_000_000_000)
+    
+    assert load_json_file(str(path)) is load_json_file(str(path))
+
+def test_mtime_change_reloads(tmp_path):
+    path = tmp_path / "questions.json"
+    write(path, '{"v": 1}', 1_000_000_000)
+    load_json_file(str(path))
+    
+    # Same size, newer modification time
+    write(path, '{"v": 2}', 2_000_000_000)
+    
+    assert load_json_file(str(path)) == {"v": 2}
+
+def test_size_change_reloads(tmp_path):
+    path = tmp_path / "questions.json"
+    write(path, '{"v": 1}', 1_000_000_000)
+    load_json_file(str(path))
+    
+    # Same modification time, different size
+    write(path, '{"v": 10}', 1_000_000_000)
+    
+    assert load_json_file(str(path)) == {"v": 10}
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_json_file(str(tmp_path / "missing.json"))
+
+
+def test_list_question_files_filters_by_name_and_type(tmp_path):
+    for name in ("questions.json", "Eval_Questions.json", "answers.json", "questions.txt"):
+        (tmp_path / name).write_text("[]")
+    (tmp_path / "question_dir.json").mkdir()
+    
+    found = sorted(os.path.basename(path) for path in list_question_files(str(tmp_path)))
+    
+    assert found == ["Eval_Questions.json", "questions.json"]
+
+def test_list_question_files_missing_dir_is_empty(tmp_path):
+    assert list_question_files(str(tmp_path / "missing")) == []
\ No newline at end of file
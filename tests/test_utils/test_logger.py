@@ -0,0 +1,29 @@
+"""Tests for safe_print."""
+
+import builtins
+import utils.logger as logger_module
+from utils.logger import safe_print, set_print_prefix
+
+def test_failed_print_falls_back_to_placeholder(monkeypatch, capsys):
+    real_print = builtins.print
+    def flaky_print(text, *args, **kwargs):
+        if text != "Processing item...":
+            raise UnicodeEncodeError("ascii", "", 0, 1, "unsupported")
+        real_print(text, *args, **kwargs)
+    monkeypatch.setattr(builtins, "print", flaky_print)
+    
+    for utf8 in (True, False):
+        monkeypatch.setattr(logger_module, "_STDOUT_UTF8", utf8)
+        safe_print("שלום")
+    
+    assert capsys.readouterr().out == "Processing item...\nProcessing item...\n"
+
+def test_prefix_applies_to_each_line(capsys):
+    set_print_prefix("[Test 1/2] ")
+    try:
+        safe_print("\nfirst\nsecond")
+    finally:
+        set_print_prefix()
+    safe_print("untagged")
+    
+    assert capsys.readouterr().out == "\n[Test 1/2] first\n[Test 1/2] second\nuntagged\n"
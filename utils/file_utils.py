@@ -0,0 +1,50 @@
+"""
+File utilities for the Datadog Multi-Agent Debugging project.
+Handles loading question files and listing the available ones.
+"""
+
+import functools
+import os
+from typing import Any, List
+from utils.text_processing import json_loads
+
+@functools.lru_cache(maxsize=32)
+def _read_json_file(file_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file once per modification time and size."""
+    with open(file_path, 'rb') as f:
+        return json_loads(f.read())
+
+def load_json_file(file_path: str) -> Any:
+    """
+    Load a JSON file, reusing the parsed result until the file changes.
+    
+    Args:
+        file_path: Path to the JSON file
+    
+    Returns:
+        Parsed JSON object, shared with the cache; callers must not modify it
+    """
+    st = os.stat(file_path)
+    return _read_json_file(file_path, st.st_mtime_ns, st.st_size)
+
+def list_question_files(data_dir: str) -> List[str]:
+    """
+    List the question files in a directory.
+    
+    Args:
+        data_dir: Directory to search
+    
+    Returns:
+        Paths of JSON files with "question" in their name, in directory order
+    """
+    if not os.path.exists(data_dir):
+        return []
+    
+    question_files = []
+    # DirEntry carries the joined path and file type, so no extra stat per entry
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and 'question' in entry.name.lower() and entry.is_file():
+                question_files.append(entry.path)
+    
+    return question_files
\ No newline at end of file
@@ -4,6 +4,8 @@ Provides safe printing and logging functionality.
 """
 
 import logging
+import sys
+import threading
 from config import LoggingConfig
 
 def setup_logging():
@@ -13,14 +15,35 @@ def setup_logging():
         format=LoggingConfig.FORMAT
     )
 
+# Serializes output when tests run on worker threads
+_print_lock = threading.Lock()
+
+# stdout's encoding is fixed at startup; a UTF-8 stream can take any text as-is
+_STDOUT_UTF8 = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "") == "utf8"
+
+# Per-thread line prefix, so progress output from concurrent tests stays attributable
+_print_context = threading.local()
+
+def set_print_prefix(prefix: str = ""):
+    """Set the prefix safe_print adds to each line printed from the current thread."""
+    _print_context.prefix = prefix
+
 def safe_print(text):
     """Print text safely, avoiding encoding issues."""
-    try:
-        print(text)
-    except (UnicodeEncodeError, ValueError):
+    prefix = getattr(_print_context, "prefix", "")
+    if prefix:
+        text = "\n".join(prefix + line if line else line for line in str(text).split("\n"))
+    with _print_lock:
         try:
-            print(text.encode('ascii', 'ignore').decode('ascii'))
-        except:
+            print(text)
+        except (UnicodeEncodeError, ValueError):
+            # Re-encoding as ASCII can't help on a UTF-8 stream, so go straight to the placeholder
+            if not _STDOUT_UTF8:
+                try:
+                    print(text.encode('ascii', 'ignore').decode('ascii'))
+                    return
+                except:
+                    pass
             print("Processing item...")
 
 def get_logger(name: str) -> logging.Logger:
@@ -4,82 +4,118 @@ Handles text extraction, formatting, and JSON parsing.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
-def extract_chunks_from_trace(trace_events: List[Dict[str, Any]]) -> str:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data: Union[str, bytes]) -> Any:
     """
-    Extract chunks from trace events based on the AWS documentation structure.
+    Parse JSON text, using orjson when it is installed.
     
     Args:
-        trace_events: List of trace events from Bedrock
+        data: JSON document as str or bytes
         
     Returns:
-        Extracted text chunks as a single string
+        Parsed JSON object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps_pretty(obj: Any) -> str:
     """
-    chunks_text = ""
+    Serialize an object to indented JSON, using orjson when it is installed.
     
-    try:
-        for trace_event in trace_events:
-            if 'trace' in trace_event:
-                trace = trace_event['trace']
-                
-                # Look for orchestrationTrace
-                if 'orchestrationTrace' in trace:
-                    orchestration = trace['orchestrationTrace']
-                    
-                    # Look for observation with actionGroupInvocationOutput
-                    if 'observation' in orchestration:
-                        observation = orchestration['observation']
-                        
-                        if 'actionGroupInvocationOutput' in observation:
-                            action_output = observation['actionGroupInvocationOutput']
-                            if 'text' in action_output:
-                                chunks_text = action_output['text']
-                                # Remove quotes if it's a JSON string
-                                if chunks_text.startswith('"') and chunks_text.endswith('"'):
-                                    try:
-                                        chunks_text = json.loads(chunks_text)
-                                    except:
-                                        pass
-                        
-                        # Also look for knowledgeBaseLookupOutput
-                        elif 'knowledgeBaseLookupOutput' in observation:
-                            kb_output = observation['knowledgeBaseLookupOutput']
-                            if 'retrievedReferences' in kb_output:
-                                references = kb_output['retrievedReferences']
-                                reference_texts = []
-                                for ref in references:
-                                    if 'content' in ref and 'text' in ref['content']:
-                                        reference_texts.append(ref['content']['text'])
-                                chunks_text = '\n\n'.join(reference_texts)
+    Args:
+        obj: JSON-serializable object
         
-        return chunks_text
-    except Exception as e:
-        print(f"Error extracting chunks from trace: {str(e)}")
-        return ""
+    Returns:
+        JSON string indented by two spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
 
-def safe_json_parse(text: str) -> Any:
+def json_dumps_line(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
     """
-    Safely parse JSON text, handling various formats.
+    Serialize an object to a single UTF-8 encoded JSON line, using orjson when it is installed.
     
     Args:
-        text: Text to parse as JSON
+        obj: JSON-serializable object
+        default: Fallback converter for objects the encoder can't serialize
         
     Returns:
-        Parsed JSON object or original text if parsing fails
+        Compact JSON document terminated by a newline
     """
-    try:
-        # Remove quotes if it's a JSON string
-        if text.startswith('"') and text.endswith('"'):
-            text = json.loads(text)
-        
-        # Try to parse as JSON
-        if isinstance(text, str) and text.strip().startswith('{'):
-            return json.loads(text)
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, default=default) + "\n").encode('utf-8')
+
+def _deep_get(data: Any, path: tuple) -> Any:
+    """Follow a tuple of keys through nested dicts, returning None on a miss."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+        if data is None:
+            return None
+    return data
+
+def _chunks_from_action_output(text: str) -> str:
+    """Return action group output text, unquoting it if it's a JSON string."""
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+        try:
+            return json_loads(text)
+        except:
+            pass
+    return text
+
+def _chunks_from_kb_references(references: List[Dict[str, Any]]) -> str:
+    """Join the text of knowledge base references."""
+    texts = []
+    for ref in references:
+        # Bind the content dict once instead of looking it up for the test and the read
+        content = ref.get('content') or {}
+        if 'text' in content:
+            texts.append(content['text'])
+    return '\n\n'.join(texts)
+
+# Location of the observation inside a trace event
+_OBSERVATION_PATH = ('trace', 'orchestrationTrace', 'observation')
+
+# Observation shapes carrying retrieved content, mapped to their extractors.
+# Paths are relative to the observation and checked in order; the first present wins.
+_CHUNK_HANDLERS = (
+    (('actionGroupInvocationOutput', 'text'), _chunks_from_action_output),
+    (('knowledgeBaseLookupOutput', 'retrievedReferences'), _chunks_from_kb_references),
+)
+
+def extract_chunks_from_trace_event(trace_event: Dict[str, Any]) -> Optional[str]:
+    """
+    Extract chunks from a single trace event, for use while streaming.
+    
+    Args:
+        trace_event: Trace event from Bedrock, shaped {"trace": {...}}
         
-        return text
-    except (json.JSONDecodeError, ValueError):
-        return text
+    Returns:
+        Extracted text chunks, or None if the event carries no retrieved content
+    """
+    try:
+        # Resolve the shared prefix once rather than once per handler
+        observation = _deep_get(trace_event, _OBSERVATION_PATH)
+        if observation is None:
+            return None
+        for path, handler in _CHUNK_HANDLERS:
+            value = _deep_get(observation, path)
+            if value is not None:
+                return handler(value)
+        return None
+    except Exception as e:
+        print(f"Error extracting chunks from trace: {str(e)}")
+        return None
 
 def format_response_for_display(response_text: str) -> str:
     """
@@ -92,12 +128,16 @@ def format_response_for_display(response_text: str) -> str:
         Formatted response string
     """
     try:
-        parsed_response = safe_json_parse(response_text)
-        if isinstance(parsed_response, dict):
-            return json.dumps(parsed_response, indent=2)
-        return str(response_text)
-    except:
+        parsed_response = json_loads(response_text)
+        # Action group output is often a JSON document wrapped in a JSON string
+        if isinstance(parsed_response, str):
+            parsed_response = json_loads(parsed_response)
+    except (ValueError, TypeError):
         return str(response_text)
+    
+    if isinstance(parsed_response, dict):
+        return json_dumps_pretty(parsed_response)
+    return str(response_text)
 
 def truncate_text(text: str, max_length: int = 100) -> str:
     """